@@ -1,38 +1,58 @@
 #!/usr/bin/env python3
 """
 Generate FullDuplex app icon - purple background with bold "FD" text.
+
+Requires NumPy and Pillow. Pillow-SIMD is a drop-in replacement with
+vectorized resampling and makes the Lanczos downscales noticeably faster:
+
+    pip uninstall pillow && pip install numpy pillow-simd
 """
 
+import PIL
 from PIL import Image, ImageDraw, ImageFont
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import os
 
-def create_icon(size=1024):
-    """Create the FullDuplex app icon at specified size."""
+# Try various bold fonts - prefer heavy/black weights
+FONT_PATHS = [
+    "/System/Library/Fonts/Supplemental/Arial Bold.ttf",
+    "/System/Library/Fonts/Supplemental/Impact.ttf",
+    "/Library/Fonts/SF-Pro-Display-Black.otf",
+    "/Library/Fonts/SF-Pro-Display-Heavy.otf",
+    "/Library/Fonts/SF-Pro-Display-Bold.otf",
+    "/System/Library/Fonts/SFNS.ttf",
+]
+
+
+@functools.lru_cache(maxsize=32)
+def load_font(font_size):
+    """Load the first available bold system font, cached per size."""
+    for font_path in FONT_PATHS:
+        if os.path.exists(font_path):
+            try:
+                return ImageFont.truetype(font_path, font_size)
+            except:
+                continue
 
-    # Create base image with transparency
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    # Fallback to default
+    return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=32)
+def text_bbox(font_size):
+    """Bounding box of the "FD" text at the given font size, cached per size."""
+    draw = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+    return draw.textbbox((0, 0), "FD", font=load_font(font_size))
 
+
+@functools.lru_cache(maxsize=16)
+def rounded_mask(size):
+    """Rounded rectangle icon mask, cached per size. Callers must not modify it."""
     # iOS icon corner radius (approximately 22.37% of size for iOS)
     corner_radius = int(size * 0.2237)
 
-    # Create gradient background - deep purple to vibrant purple
-    gradient = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-
-    # Purple gradient colors (deep violet to bright purple)
-    color_top = (88, 28, 135)      # Deep purple (#581C87)
-    color_bottom = (147, 51, 234)  # Vibrant purple (#9333EA)
-
-    for y in range(size):
-        ratio = y / size
-        # Ease the gradient for smoother transition
-        ratio = ratio * ratio * (3 - 2 * ratio)  # Smoothstep
-        r = int(color_top[0] + (color_bottom[0] - color_top[0]) * ratio)
-        g = int(color_top[1] + (color_bottom[1] - color_top[1]) * ratio)
-        b = int(color_top[2] + (color_bottom[2] - color_top[2]) * ratio)
-        for x in range(size):
-            gradient.putpixel((x, y), (r, g, b, 255))
-
-    # Create rounded rectangle mask
     mask = Image.new('L', (size, size), 0)
     mask_draw = ImageDraw.Draw(mask)
     mask_draw.rounded_rectangle(
@@ -40,49 +60,46 @@ def create_icon(size=1024):
         radius=corner_radius,
         fill=255
     )
+    return mask
+
+
+def create_icon(size=1024):
+    """Create the FullDuplex app icon at specified size."""
+
+    # Create base image with transparency
+    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
 
-    # Apply mask to gradient
-    img = Image.composite(gradient, img, mask)
+    # Purple gradient colors (deep violet to bright purple)
+    color_top = np.array((88, 28, 135), dtype=np.float64)      # Deep purple (#581C87)
+    color_bottom = np.array((147, 51, 234), dtype=np.float64)  # Vibrant purple (#9333EA)
+
+    # Create gradient background - deep purple to vibrant purple
+    ratio = np.arange(size, dtype=np.float64) / size
+    # Ease the gradient for smoother transition
+    ratio = ratio * ratio * (3 - 2 * ratio)  # Smoothstep
+    column = (color_top[None, :] + (color_bottom - color_top)[None, :] * ratio[:, None]).astype(np.uint8)
+
+    # Every row is a single color, so build a 1px-wide column and stretch it
+    alpha = np.full((size, 1), 255, dtype=np.uint8)
+    column = np.concatenate((column, alpha), axis=1)[:, None, :]
+    gradient = Image.fromarray(column, 'RGBA').resize((size, size), Image.Resampling.NEAREST)
+
+    # Apply rounded rectangle mask to gradient
+    img = Image.composite(gradient, img, rounded_mask(size))
     draw = ImageDraw.Draw(img)
 
     # Calculate center
     cx, cy = size // 2, size // 2
 
-    # Load a bold font - try system fonts
+    # Load a bold font and measure "FD" (both cached per font size)
     font_size = int(size * 0.42)
-    font = None
-
-    # Try various bold fonts - prefer heavy/black weights
-    font_paths = [
-        "/System/Library/Fonts/Supplemental/Arial Bold.ttf",
-        "/System/Library/Fonts/Supplemental/Impact.ttf",
-        "/Library/Fonts/SF-Pro-Display-Black.otf",
-        "/Library/Fonts/SF-Pro-Display-Heavy.otf",
-        "/Library/Fonts/SF-Pro-Display-Bold.otf",
-        "/System/Library/Fonts/SFNS.ttf",
-    ]
-
-    for font_path in font_paths:
-        if os.path.exists(font_path):
-            try:
-                font = ImageFont.truetype(font_path, font_size)
-                break
-            except:
-                continue
-
-    if font is None:
-        # Fallback to default
-        font = ImageFont.load_default()
-
-    # Draw "FD" text centered
+    font = load_font(font_size)
     text = "FD"
+    bbox = text_bbox(font_size)
 
-    # Get text bounding box for centering
-    bbox = draw.textbbox((0, 0), text, font=font)
+    # Calculate position to center text
     text_width = bbox[2] - bbox[0]
     text_height = bbox[3] - bbox[1]
-
-    # Calculate position to center text
     text_x = cx - text_width // 2 - bbox[0]
     text_y = cy - text_height // 2 - bbox[1]
 
@@ -109,6 +126,10 @@ def main():
         'AppIcon-20': 20,      # Notification @1x
     }
 
+    # Pillow-SIMD releases carry a ".postN" suffix; plain Pillow does not
+    if 'post' not in PIL.__version__:
+        print(f"Note: using Pillow {PIL.__version__}; install pillow-simd for faster resizing")
+
     # Generate master at 1024
     print("Generating master icon at 1024x1024...")
     master = create_icon(1024)
@@ -117,12 +138,21 @@ def main():
     master.save('FullDuplex-AppIcon.png', 'PNG')
     print("Saved: FullDuplex-AppIcon.png")
 
-    # Generate all sizes from master using high-quality downscaling
-    for name, size in sizes.items():
-        if size != 1024:
-            resized = master.resize((size, size), Image.Resampling.LANCZOS)
-            filename = f'{name}.png'
-            resized.save(filename, 'PNG')
+    # Intermediate for small sizes, so their Lanczos pass reads ~16x fewer pixels
+    mid = master.resize((256, 256), Image.Resampling.LANCZOS)
+
+    def save_resized(name, size):
+        source = mid if size <= 128 else master
+        resized = source.resize((size, size), Image.Resampling.LANCZOS)
+        filename = f'{name}.png'
+        resized.save(filename, 'PNG')
+        return filename
+
+    # Generate all sizes from master using high-quality downscaling. PIL's
+    # resize and PNG encoding release the GIL, so sizes run in parallel.
+    targets = [(name, size) for name, size in sizes.items() if size != 1024]
+    with ThreadPoolExecutor(max_workers=min(8, len(targets))) as executor:
+        for filename in executor.map(lambda target: save_resized(*target), targets):
             print(f"Saved: {filename}")
 
     print("\nDone! Main icon: FullDuplex-AppIcon.png")
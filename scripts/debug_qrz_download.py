@@ -15,12 +15,16 @@ Usage:
 import sys
 import os
 import re
-import html
 import time
-import urllib.request
+import http.client
+import threading
+import urllib.error
 import urllib.parse
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from dataclasses import dataclass
+from itertools import islice
+from dataclasses import dataclass, field
 from typing import Optional
 
 
@@ -28,9 +32,26 @@ from typing import Optional
 BASE_URL = "https://logbook.qrz.com/api"
 USER_AGENT = "CarrierWave/1.0 (Debug Script)"
 PAGE_SIZE = 2000  # Same as app
+MAX_PREALLOCATED_BYTES = 100 * 1024 * 1024  # Larger bodies fall back to read()
 
+# Per-thread keep-alive connections, see get_connection()
+_thread_state = threading.local()
 
-@dataclass
+# ADIF tags, compiled once. Only <eor> and the fields the parser consumes are
+# matched, so the regex engine skips every other tag without returning to
+# Python. The length is optional so <eor> matches too, letting the parser
+# walk the whole blob in a single scan.
+_FIELD_RE = re.compile(
+    r'<(CALL|BAND|MODE|QSO_DATE|TIME_ON|APP_QRZLOG_LOGID|EOR)(?::(\d+)(?::[^>]*)?)?>([^<]*)',
+    re.IGNORECASE
+)
+
+# HTML entities QRZ uses to escape the ADIF payload
+_NAMED_ENTITIES = {"lt": "<", "gt": ">", "amp": "&", "quot": '"', "apos": "'"}
+_ENTITY_RE = re.compile(r'&(?:(lt|gt|amp|quot|apos)|#(\d+)|#[xX]([0-9a-fA-F]+));')
+
+
+@dataclass(slots=True)
 class QRZStatusResponse:
     callsign: str
     book_id: Optional[str]
@@ -38,14 +59,47 @@ class QRZStatusResponse:
     confirmed_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class QRZFetchedQSO:
     callsign: str
     band: str
     mode: str
     timestamp: datetime
     log_id: Optional[int]  # APP_QRZLOG_LOGID for pagination
-    raw_adif: str
+
+
+@dataclass(slots=True)
+class QRZQSOColumns:
+    """
+    Fetched QSOs stored column-wise (one list per field) rather than as one
+    object per QSO, so analysis can hand whole columns to min/max/Counter.
+    """
+    callsigns: list[str] = field(default_factory=list)
+    bands: list[str] = field(default_factory=list)
+    modes: list[str] = field(default_factory=list)
+    timestamps: list[datetime] = field(default_factory=list)
+    log_ids: list[Optional[int]] = field(default_factory=list)  # APP_QRZLOG_LOGID
+
+    def __len__(self) -> int:
+        return len(self.callsigns)
+
+    def extend(self, other: "QRZQSOColumns"):
+        self.callsigns.extend(other.callsigns)
+        self.bands.extend(other.bands)
+        self.modes.extend(other.modes)
+        self.timestamps.extend(other.timestamps)
+        self.log_ids.extend(other.log_ids)
+
+    def add_record(self, callsign: str, band: str, mode: str, qso_date: str,
+                   time_on: str, log_id_str: str):
+        """Append one record's fields, skipping records without call/band/mode"""
+        if not (callsign and band and mode):
+            return
+        self.callsigns.append(callsign)
+        self.bands.append(band)
+        self.modes.append(mode)
+        self.timestamps.append(parse_timestamp(qso_date, time_on) or datetime.now())
+        self.log_ids.append(safe_int(log_id_str))
 
 
 def log(level: str, message: str):
@@ -86,104 +140,205 @@ def parse_response(response: str) -> dict:
     # Check if there's an ADIF field
     adif_marker = "ADIF="
     adif_pos = response.find(adif_marker)
+    end = adif_pos if adif_pos != -1 else len(response)
+
+    # Walk the key=value pairs before ADIF (or the whole response) by index,
+    # so only the small keys and values are copied out
+    start = 0
+    while start < end:
+        next_amp = response.find("&", start, end)
+        if next_amp == -1:
+            next_amp = end
+        eq = response.find("=", start, next_amp)
+        if eq != -1:
+            result[response[start:eq]] = response[eq + 1:next_amp]
+        start = next_amp + 1
 
     if adif_pos != -1:
-        # Parse everything before ADIF normally
-        before_adif = response[:adif_pos]
-        for pair in before_adif.split("&"):
-            if not pair:
-                continue
-            parts = pair.split("=", 1)
-            if len(parts) >= 2:
-                result[parts[0]] = parts[1]
-
         # The ADIF value is everything after "ADIF="
         result["ADIF"] = response[adif_pos + len(adif_marker):]
-    else:
-        # No ADIF field, parse normally
-        for pair in response.split("&"):
-            parts = pair.split("=", 1)
-            if len(parts) >= 2:
-                result[parts[0]] = parts[1]
 
     return result
 
 
+def replace_entity(match: re.Match) -> str:
+    """Resolve one entity matched by _ENTITY_RE"""
+    named, decimal, hexadecimal = match.groups()
+    if named:
+        return _NAMED_ENTITIES[named]
+    try:
+        return chr(int(decimal) if decimal else int(hexadecimal, 16))
+    except (ValueError, OverflowError):
+        return match.group(0)
+
+
 def decode_adif(encoded: str) -> str:
-    """Decode HTML entities in ADIF string"""
-    return html.unescape(encoded)
+    """
+    Decode HTML entities in ADIF string.
+    Mirrors QRZClient.decodeADIF(): QRZ only emits the basic entities, so this
+    skips html.unescape()'s full entity table.
+    """
+    return _ENTITY_RE.sub(replace_entity, encoded)
 
 
-def parse_adif_records(adif: str) -> list[QRZFetchedQSO]:
-    """Parse ADIF string into QSO records"""
-    qsos = []
+def safe_int(value: str) -> Optional[int]:
+    """Parse an integer, returning None if the string isn't one"""
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def parse_timestamp(qso_date: str, time_on: str) -> Optional[datetime]:
+    """Parse QSO_DATE (YYYYMMDD) and TIME_ON (HHMM[SS]) by slicing; strptime is slow per QSO"""
+    if len(qso_date) != 8:
+        return None
+    try:
+        year, month, day = int(qso_date[0:4]), int(qso_date[4:6]), int(qso_date[6:8])
+        if not time_on:
+            return datetime(year, month, day)
+        # Normalize time to 6 digits (HHMMSS)
+        time_on = time_on.ljust(6, '0')[:6]
+        return datetime(year, month, day,
+                        int(time_on[0:2]), int(time_on[2:4]), int(time_on[4:6]))
+    except ValueError:
+        return None
+
+
+def parse_adif_records_columnar(adif: str) -> QRZQSOColumns:
+    """
+    Parse ADIF string into QSO columns in a single pass.
+    Only the fields used downstream are kept; everything else is skipped.
+    """
+    columns = QRZQSOColumns()
+    callsign = band = mode = qso_date = time_on = log_id_str = ""
 
-    # Split by <eor> (end of record)
-    records = re.split(r'<eor>', adif, flags=re.IGNORECASE)
+    for match in _FIELD_RE.finditer(adif):
+        name, length, value = match.groups()
+        field_name = name.upper()
 
-    for record in records:
-        if not record.strip():
+        # <eor> (end of record) flushes the fields collected so far
+        if field_name == "EOR":
+            columns.add_record(callsign, band, mode, qso_date, time_on, log_id_str)
+            callsign = band = mode = qso_date = time_on = log_id_str = ""
             continue
 
-        # Parse fields
-        fields = {}
-        pattern = r'<(\w+):(\d+)(?::[^>]*)?>([^<]*)'
-        for match in re.finditer(pattern, record, re.IGNORECASE):
-            field_name = match.group(1).upper()
-            field_len = int(match.group(2))
-            field_value = match.group(3)[:field_len]
-            fields[field_name] = field_value
-
-        # Extract key fields
-        callsign = fields.get("CALL", "")
-        band = fields.get("BAND", "")
-        mode = fields.get("MODE", "")
-
-        # Parse timestamp
-        qso_date = fields.get("QSO_DATE", "")
-        time_on = fields.get("TIME_ON", "")
-        timestamp = None
-        if qso_date:
-            try:
-                if time_on:
-                    # Normalize time to 6 digits (HHMMSS)
-                    time_on = time_on.ljust(6, '0')[:6]
-                    timestamp = datetime.strptime(f"{qso_date}{time_on}", "%Y%m%d%H%M%S")
-                else:
-                    timestamp = datetime.strptime(qso_date, "%Y%m%d")
-            except ValueError:
-                pass
+        # Skip consumed fields that are missing a length
+        if length is None:
+            continue
 
-        # Extract log_id for pagination (APP_QRZLOG_LOGID)
-        log_id_str = fields.get("APP_QRZLOG_LOGID", "")
-        log_id = int(log_id_str) if log_id_str.isdigit() else None
+        if field_name == "CALL":
+            callsign = value[:int(length)]
+        elif field_name == "BAND":
+            band = value[:int(length)]
+        elif field_name == "MODE":
+            mode = value[:int(length)]
+        elif field_name == "QSO_DATE":
+            qso_date = value[:int(length)]
+        elif field_name == "TIME_ON":
+            time_on = value[:int(length)]
+        elif field_name == "APP_QRZLOG_LOGID":
+            log_id_str = value[:int(length)]
 
-        if callsign and band and mode:
-            qsos.append(QRZFetchedQSO(
-                callsign=callsign,
-                band=band,
-                mode=mode,
-                timestamp=timestamp or datetime.now(),
-                log_id=log_id,
-                raw_adif=record.strip()
-            ))
+    # Trailing record without a closing <eor>
+    columns.add_record(callsign, band, mode, qso_date, time_on, log_id_str)
 
-    return qsos
+    return columns
 
 
-def make_request(url: str, data: dict) -> bytes:
-    """Make POST request to QRZ API, return raw bytes"""
-    encoded_data = form_encode(data).encode('utf-8')
+def parse_adif_records(adif: str) -> list[QRZFetchedQSO]:
+    """Parse ADIF string into QSO records (row-wise view of the columnar parse)"""
+    columns = parse_adif_records_columnar(adif)
+    return [
+        QRZFetchedQSO(callsign=c, band=b, mode=m, timestamp=t, log_id=i)
+        for c, b, m, t, i in zip(columns.callsigns, columns.bands, columns.modes,
+                                 columns.timestamps, columns.log_ids)
+    ]
+
 
-    req = urllib.request.Request(url, data=encoded_data, method='POST')
-    req.add_header('User-Agent', USER_AGENT)
-    req.add_header('Content-Type', 'application/x-www-form-urlencoded')
+def get_connection(scheme: str, netloc: str) -> http.client.HTTPConnection:
+    """
+    Return this thread's keep-alive connection to netloc, creating it if needed.
+    Connections are per thread because page prefetching issues requests from a
+    worker thread, and http.client connections are not thread-safe.
+    """
+    connections = getattr(_thread_state, "connections", None)
+    if connections is None:
+        connections = _thread_state.connections = {}
+
+    conn = connections.get((scheme, netloc))
+    if conn is None:
+        conn_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = connections[(scheme, netloc)] = conn_class(netloc, timeout=60)
+    return conn
 
-    with urllib.request.urlopen(req, timeout=60) as response:
+
+def read_body(response: http.client.HTTPResponse) -> bytes | bytearray:
+    """
+    Read a response body.
+    When Content-Length is known the body is read into a single preallocated
+    buffer, avoiding an extra copy of multi-MB ADIF pages.
+    """
+    content_length = safe_int(response.getheader('Content-Length', ''))
+    if content_length is None or not 0 < content_length <= MAX_PREALLOCATED_BYTES:
         return response.read()
 
+    buf = bytearray(content_length)
+    view = memoryview(buf)
+    received = 0
+    while received < content_length:
+        n = response.readinto(view[received:])
+        if not n:
+            break
+        received += n
+    view.release()
+
+    if received < content_length:
+        del buf[received:]
+    return buf
 
-def decode_response(data: bytes) -> str:
+
+def make_request(url: str, data: dict) -> bytes | bytearray:
+    """
+    Make POST request to QRZ API, return raw bytes.
+    Reuses a keep-alive connection so each page doesn't pay for a new TLS handshake.
+    """
+    encoded_data = form_encode(data).encode('utf-8')
+    headers = {
+        'User-Agent': USER_AGENT,
+        'Content-Type': 'application/x-www-form-urlencoded',
+    }
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+
+    conn = get_connection(parts.scheme, parts.netloc)
+    retry = conn.sock is not None  # Idle connections may have been dropped by the server
+    while True:
+        try:
+            conn.request('POST', path, body=encoded_data, headers=headers)
+            response = conn.getresponse()
+            body = read_body(response)
+            break
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            if not retry:
+                raise
+            log_debug("Keep-alive connection dropped, reconnecting")
+            retry = False
+        except Exception:
+            conn.close()
+            raise
+
+    if response.will_close:
+        conn.close()
+
+    if response.status >= 400:
+        raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+
+    return body
+
+
+def decode_response(data: bytes | bytearray) -> str:
     """
     Decode response bytes to string.
     Mirrors QRZClient.decodeResponseData() - tries UTF-8 first, then Latin-1.
@@ -232,116 +387,170 @@ def validate_api_key(api_key: str) -> QRZStatusResponse:
     )
 
 
-def fetch_qsos(api_key: str, since: Optional[datetime] = None) -> list[QRZFetchedQSO]:
-    """
-    Fetch QSOs from QRZ logbook with pagination.
-
-    FIXED: Uses AFTERLOGID for pagination instead of OFFSET.
-    QRZ API requires AFTERLOGID:<highest_logid+1> for subsequent pages.
-    """
-    all_qsos = []
-    after_log_id = 0  # Start from beginning
-    page_num = 1
-
-    while True:
-        log_info(f"Fetching page {page_num} (afterLogId={after_log_id}, pageSize={PAGE_SIZE})...")
-
-        # Build options - use AFTERLOGID for pagination (not OFFSET!)
-        option_parts = [f"MAX:{PAGE_SIZE}", f"AFTERLOGID:{after_log_id}"]
-        if since:
-            option_parts.append(f"MODSINCE:{since.strftime('%Y-%m-%d')}")
+def fetch_request_data(api_key: str, after_log_id: int, since: Optional[datetime]) -> dict:
+    """Build FETCH form data for the page after after_log_id"""
+    # Build options - use AFTERLOGID for pagination (not OFFSET!)
+    option_parts = [f"MAX:{PAGE_SIZE}", f"AFTERLOGID:{after_log_id}"]
+    if since:
+        option_parts.append(f"MODSINCE:{since.strftime('%Y-%m-%d')}")
 
-        data = {
-            "KEY": api_key,
-            "ACTION": "FETCH",
-            "OPTION": ",".join(option_parts)
-        }
+    return {
+        "KEY": api_key,
+        "ACTION": "FETCH",
+        "OPTION": ",".join(option_parts)
+    }
 
-        log_debug(f"POST {BASE_URL} ACTION=FETCH OPTION={data['OPTION']}")
 
-        start_time = time.time()
-        response_bytes = make_request(BASE_URL, data)
-        elapsed = time.time() - start_time
+def max_log_id_in(log_ids: str) -> int:
+    """Highest ID in a comma-separated LOGIDS value, or 0 if there are none"""
+    return max((i for i in map(safe_int, log_ids.split(",")) if i), default=0)
 
-        log_debug(f"Response received in {elapsed:.2f}s, {len(response_bytes)} bytes")
-        response = decode_response(response_bytes)
 
-        parsed = parse_response(response)
-        result = parsed.get("RESULT", "")
-        reason = parsed.get("REASON", "").lower()
-        response_count = int(parsed.get("COUNT", "0"))
+def delayed_request(url: str, data: dict, delay: float) -> bytes | bytearray:
+    """make_request() after a rate-limiting delay, for prefetching the next page"""
+    time.sleep(delay)
+    return make_request(url, data)
 
-        log_debug(f"RESULT={result}, COUNT={response_count}, REASON={parsed.get('REASON', 'N/A')}")
 
-        # Show full response if it's short (likely an error)
-        if len(response_bytes) < 500:
-            log_debug(f"Full response: {response}")
+def fetch_qsos(api_key: str, since: Optional[datetime] = None) -> QRZQSOColumns:
+    """
+    Fetch QSOs from QRZ logbook with pagination.
 
-        # Handle "no log entries found" case
-        if "no log entries found" in reason:
-            log_info("No (more) QSOs found (reason: no log entries)")
-            break
+    FIXED: Uses AFTERLOGID for pagination instead of OFFSET.
+    QRZ API requires AFTERLOGID:<highest_logid+1> for subsequent pages.
+    """
+    all_qsos = QRZQSOColumns()
+    after_log_id = 0  # Start from beginning
+    page_num = 1
 
-        # FAIL with count=0 means no more records
-        if result == "FAIL" and response_count == 0:
-            log_info("No more QSOs (RESULT=FAIL, COUNT=0)")
-            break
+    # Full pages list their log IDs in LOGIDS, so the next page can be requested
+    # in the background while the current page's ADIF is still being parsed
+    executor = ThreadPoolExecutor(max_workers=1)
+    prefetch = None  # (after_log_id, future) for a speculatively requested page
 
-        if result != "OK":
-            if result == "AUTH":
-                raise Exception("Session expired")
-            raise Exception(f"Fetch failed: {parsed.get('REASON', result)}")
+    try:
+        while True:
+            log_info(f"Fetching page {page_num} (afterLogId={after_log_id}, pageSize={PAGE_SIZE})...")
 
-        encoded_adif = parsed.get("ADIF", "")
-        if not encoded_adif:
-            log_warn("No ADIF field in response")
-            break
+            data = fetch_request_data(api_key, after_log_id, since)
+            log_debug(f"POST {BASE_URL} ACTION=FETCH OPTION={data['OPTION']}")
 
-        adif = decode_adif(encoded_adif)
-        page_qsos = parse_adif_records(adif)
+            start_time = time.time()
+            if prefetch and prefetch[0] == after_log_id:
+                log_debug("Using prefetched response")
+                response_bytes = prefetch[1].result()
+            else:
+                response_bytes = make_request(BASE_URL, data)
+            prefetch = None
+            elapsed = time.time() - start_time
+
+            log_debug(f"Response received in {elapsed:.2f}s, {len(response_bytes)} bytes")
+            response = decode_response(response_bytes)
+
+            parsed = parse_response(response)
+            result = parsed.get("RESULT", "")
+            reason = parsed.get("REASON", "").lower()
+            response_count = int(parsed.get("COUNT", "0"))
+
+            log_debug(f"RESULT={result}, COUNT={response_count}, REASON={parsed.get('REASON', 'N/A')}")
+
+            # Show full response if it's short (likely an error)
+            if len(response_bytes) < 500:
+                log_debug(f"Full response: {response}")
+
+            # Handle "no log entries found" case
+            if "no log entries found" in reason:
+                log_info("No (more) QSOs found (reason: no log entries)")
+                break
+
+            # FAIL with count=0 means no more records
+            if result == "FAIL" and response_count == 0:
+                log_info("No more QSOs (RESULT=FAIL, COUNT=0)")
+                break
+
+            if result != "OK":
+                if result == "AUTH":
+                    raise Exception("Session expired")
+                raise Exception(f"Fetch failed: {parsed.get('REASON', result)}")
+
+            encoded_adif = parsed.get("ADIF", "")
+            if not encoded_adif:
+                log_warn("No ADIF field in response")
+                break
+
+            # Speculatively request the next page before parsing this one
+            if response_count == PAGE_SIZE:
+                listed_max_log_id = max_log_id_in(parsed.get("LOGIDS", ""))
+                if listed_max_log_id:
+                    next_after_log_id = listed_max_log_id + 1
+                    log_debug(f"Prefetching next page (afterLogId={next_after_log_id})")
+                    prefetch = (next_after_log_id, executor.submit(
+                        delayed_request, BASE_URL,
+                        fetch_request_data(api_key, next_after_log_id, since), 0.2
+                    ))
+
+            adif = decode_adif(encoded_adif)
+            page_qsos = parse_adif_records_columnar(adif)
+
+            log_info(f"Page {page_num}: parsed {len(page_qsos)} QSOs (API COUNT={response_count})")
+
+            if len(page_qsos) != response_count:
+                log_warn(f"Mismatch: parsed {len(page_qsos)} but API COUNT={response_count}")
+
+            # Find the highest log_id in this batch for next pagination
+            max_log_id = 0
+            missing_log_ids = 0
+            for log_id in page_qsos.log_ids:
+                if log_id:
+                    max_log_id = max(max_log_id, log_id)
+                else:
+                    missing_log_ids += 1
 
-        log_info(f"Page {page_num}: parsed {len(page_qsos)} QSOs (API COUNT={response_count})")
+            if missing_log_ids > 0:
+                log_warn(f"{missing_log_ids} QSOs missing APP_QRZLOG_LOGID field")
 
-        if len(page_qsos) != response_count:
-            log_warn(f"Mismatch: parsed {len(page_qsos)} but API COUNT={response_count}")
+            log_debug(f"Max log_id in this batch: {max_log_id}")
 
-        # Find the highest log_id in this batch for next pagination
-        max_log_id = 0
-        missing_log_ids = 0
-        for qso in page_qsos:
-            if qso.log_id:
-                max_log_id = max(max_log_id, qso.log_id)
-            else:
-                missing_log_ids += 1
+            all_qsos.extend(page_qsos)
 
-        if missing_log_ids > 0:
-            log_warn(f"{missing_log_ids} QSOs missing APP_QRZLOG_LOGID field")
+            # Check if we should continue pagination
+            if len(page_qsos) < PAGE_SIZE:
+                log_debug(f"Last page (got {len(page_qsos)} < {PAGE_SIZE})")
+                break
 
-        log_debug(f"Max log_id in this batch: {max_log_id}")
+            if max_log_id == 0:
+                log_error("Cannot paginate: no log_id values found in QSOs")
+                break
 
-        all_qsos.extend(page_qsos)
+            # Next page starts after highest log_id
+            after_log_id = max_log_id + 1
+            page_num += 1
 
-        # Check if we should continue pagination
-        if len(page_qsos) < PAGE_SIZE:
-            log_debug(f"Last page (got {len(page_qsos)} < {PAGE_SIZE})")
-            break
+            if prefetch and prefetch[0] == after_log_id:
+                continue  # Prefetch already waited out the rate limit
+            if prefetch:
+                log_warn(f"LOGIDS disagreed with parsed log_ids; discarding prefetch "
+                         f"(afterLogId={prefetch[0]})")
+                prefetch = None
 
-        if max_log_id == 0:
-            log_error("Cannot paginate: no log_id values found in QSOs")
-            break
+            # Rate limiting delay
+            log_debug("Sleeping 200ms before next page...")
+            time.sleep(0.2)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
-        # Next page starts after highest log_id
-        after_log_id = max_log_id + 1
-        page_num += 1
+    return all_qsos
 
-        # Rate limiting delay
-        log_debug("Sleeping 200ms before next page...")
-        time.sleep(0.2)
 
-    return all_qsos
+def log_breakdown(title: str, values: list[str]):
+    """Log how often each value occurs, most common first"""
+    log_info(f"\n{title}:")
+    # Counter tallies a whole column in C, so no per-QSO Python loop is needed
+    for value, count in Counter(values).most_common():
+        log_info(f"  {value}: {count}")
 
 
-def analyze_qsos(qsos: list[QRZFetchedQSO]):
+def analyze_qsos(qsos: QRZQSOColumns):
     """Analyze and print statistics about downloaded QSOs"""
     if not qsos:
         log_info("No QSOs to analyze")
@@ -352,32 +561,19 @@ def analyze_qsos(qsos: list[QRZFetchedQSO]):
     log_info(f"{'='*60}")
 
     # Date range
-    dates = [q.timestamp for q in qsos if q.timestamp]
-    if dates:
-        earliest = min(dates)
-        latest = max(dates)
-        log_info(f"Date range: {earliest.strftime('%Y-%m-%d')} to {latest.strftime('%Y-%m-%d')}")
-
-    # Band breakdown
-    bands = {}
-    for q in qsos:
-        bands[q.band] = bands.get(q.band, 0) + 1
-    log_info(f"\nBands:")
-    for band, count in sorted(bands.items(), key=lambda x: -x[1]):
-        log_info(f"  {band}: {count}")
-
-    # Mode breakdown
-    modes = {}
-    for q in qsos:
-        modes[q.mode] = modes.get(q.mode, 0) + 1
-    log_info(f"\nModes:")
-    for mode, count in sorted(modes.items(), key=lambda x: -x[1]):
-        log_info(f"  {mode}: {count}")
+    earliest = min(qsos.timestamps)
+    latest = max(qsos.timestamps)
+    log_info(f"Date range: {earliest.strftime('%Y-%m-%d')} to {latest.strftime('%Y-%m-%d')}")
+
+    # Band and mode breakdowns
+    log_breakdown("Bands", qsos.bands)
+    log_breakdown("Modes", qsos.modes)
 
     # Sample QSOs
     log_info(f"\nSample QSOs (first 5):")
-    for q in qsos[:5]:
-        log_info(f"  {q.timestamp.strftime('%Y-%m-%d %H:%M')} {q.callsign:10} {q.band:6} {q.mode}")
+    sample = zip(qsos.timestamps, qsos.callsigns, qsos.bands, qsos.modes)
+    for timestamp, callsign, band, mode in islice(sample, 5):
+        log_info(f"  {timestamp.strftime('%Y-%m-%d %H:%M')} {callsign:10} {band:6} {mode}")
 
 
 def main():